@@ -1,59 +1,225 @@
 import codecs
+from array import array
+import functools
 import logging
 import os
 import os.path
 import re
 import subprocess
+import sys
 import time
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# Shared logger for objects created with logging turned off. Disabled
+# loggers drop records before formatting them; propagate and the
+# NullHandler keep it quiet even if logging config re-enables it.
+_NULL_LOGGER = logging.getLogger('pygitlog.null')
+_NULL_LOGGER.disabled = True
+_NULL_LOGGER.propagate = False
+_NULL_LOGGER.addHandler(logging.NullHandler())
+
+# Bytes stripped from git output before decoding it as ASCII
+_HIGH_BYTES = bytes(range(128, 256))
+
+# Pulls the email address out of a "Name <email>" developer string
+_EMAIL_RE = re.compile(r"<([^>]*)>")
+
+# Matches the header block of one commit in `git log --pretty=raw`,
+# whose lines always come in this order. Anything after the committer
+# line (other headers, the indented message) is skipped by the regex
+# engine while it searches for the next literal "\ncommit ".
+_COMMIT_RE = re.compile(rb"\ncommit ([^\n]*)\ntree ([^\n]*)\n((?:parent [^\n]*\n)*)author ([^\n]*)\ncommitter ([^\n]*)")
+
+# `git log` arguments producing only the fields Parser.parseFormatted
+# keeps, NUL-separated: hash, parent hashes, tree, then name, email,
+# epoch and timezone for the author and again for the committer.
+# Parents are listed before their children (see Parser._storeCommit).
+_FORMAT_ARGS = ["log", "--reverse", "--topo-order", "-z", "--date=format:%z", "--format=%H%x00%P%x00%T%x00%an%x00%ae%x00%at%x00%ad%x00%cn%x00%ce%x00%ct%x00%cd"]
+_FORMAT_FIELDS = 11
+
+# `git log` arguments for the raw fallback, parents before children
+_RAW_ARGS = ["log", "--reverse", "--topo-order", "--pretty=raw"]
+
+# `git` arguments for the object reader behind History.readObject
+_CAT_FILE_ARGS = ["cat-file", "--batch"]
+
+@functools.lru_cache(maxsize=None)
+def _parseDeveloperKey(devKey):
+    """
+    Split a "Name <email>" developer string into a (name, email) tuple.
+    Surrounding whitespace is trimmed from both, as libgit2 does, so the
+    result matches what every other reader produces for the same ident.
+    Cached, since the same developers recur across commits and parses.
+    """
+    
+    m = _EMAIL_RE.search(devKey)
+    if m is None:
+        raise ValueError("Unrecognizable developer string: " + devKey)
+    return (devKey[:m.start()].strip(), m.group(1).strip())
+
+@functools.lru_cache(maxsize=None)
+def _gitSupportsDateFormat():
+    """
+    Whether the installed git understands --date=format (git 2.6 and
+    later), which _FORMAT_ARGS relies on. Checked once per process.
+    """
+    
+    m = re.search(rb"(\d+)\.(\d+)", subprocess.check_output(["git", "--version"]))
+    return m is None or (int(m.group(1)), int(m.group(2))) >= (2, 6)
+
 class History:
     """
     Represents the complete history of a single Git repository. Initialize
     with a file path pointing to a valid Git repo; does not currently
     support git: or http: URLs.
+    
+    If pygit2 is installed, the history is read directly from the
+    repository's object database; otherwise `git log` is run and its
+    output parsed.
+    
+    readObject keeps a `git cat-file` process open between calls; use
+    the History as a context manager, or call close(), to shut it down.
     """
     
     def __init__(self, path, log=logging.NOTSET):
+        self._catFile = None
         self.log = log
         if self.log:
             self.logger = logging.getLogger('pygitlog.History')
         else:
-            self.logger = NullLogger()
+            self.logger = _NULL_LOGGER
         
         # Normalize and store path
         if path[0] == '~':
             path = os.path.expanduser(path)
         self.path = os.path.normpath(path)
         
-        self.logger.info("Created GitHistory with path " + self.path)
-        
-        # Grab and store commit info
-        #os.chdir(self.path)
-        #logText = subprocess.getoutput("git log --pretty=raw")
-        logLines = []
-        logProcess = subprocess.Popen("git log --pretty=raw", stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=self.path, shell=True)
-        for line in logProcess.stdout:
-            logLines.append(str(bytes([b for b in line if b < 128]), 'ascii', 'replace'))
-        logText = "".join(logLines)
-        
-        # Parse commit info
-        stime = time.time()
-        p = Parser(log=self.log)
-        p.parse(logText)
+        self.logger.info("Created GitHistory with path %s", self.path)
+        
+        if pygit2 is not None:
+            # Walk the object database directly
+            stime = time.time()
+            p = Walker(log=self.log)
+            p.walk(self.path)
+        else:
+            # Grab and parse commit info, asking git for just the fields
+            # we need; older gits without --date=format get the raw log
+            stime = time.time()
+            p = Parser(log=self.log)
+            if _gitSupportsDateFormat():
+                (logArgs, parse) = (_FORMAT_ARGS, p.parseFormatted)
+            else:
+                self.logger.info("git predates --date=format; using raw log")
+                (logArgs, parse) = (_RAW_ARGS, p.parse)
+            (status, logText) = self._runGit(logArgs)
+            if status != 0:
+                raise subprocess.CalledProcessError(status, ["git"] + logArgs)
+            parse(logText)
         self.commits = p.getCommits()
         self.authors = p.getAuthors()
+        self.columns = p.getColumns()
+        
+        # Index authors by name. Commits are stored oldest first, so
+        # letting later rows overwrite earlier ones means a shared name
+        # resolves to whoever authored the newest commit, as it did when
+        # history was read newest first
+        self._authorsByName = {}
+        authorList = self.columns.authors
+        for authorIndex in self.columns.authorIndices:
+            author = authorList[authorIndex]
+            self._authorsByName[author.name] = author
         etime = time.time()
         
         self.logger.info("Parsing complete:")
-        self.logger.info("    {} commits".format(len(self.commits)))
-        self.logger.info("    {} authors".format(len(self.authors)))
-        self.logger.info("    {} committers".format(len(self.authors)))
-        self.logger.info("    Operation took {} seconds".format(etime - stime))
+        self.logger.info("    %d commits", len(self.commits))
+        self.logger.info("    %d authors", len(self.authors))
+        self.logger.info("    %d committers", len(self.authors))
+        self.logger.info("    Operation took %s seconds", etime - stime)
     
     def authorWithName(self, name):
-        for aKey in self.authors:
-            if self.authors[aKey].name == name:
-                return self.authors[aKey]
+        """
+        Find the author with the given name, or None if there is none.
+        If several authors share the name, returns the one who wrote the
+        most recent of their commits.
+        """
+        
+        return self._authorsByName.get(name)
+    
+    def readObject(self, hashKey):
+        """
+        Read a single object from the repository. Returns a tuple
+        (type, data), where type is the object type string (e.g. "tree")
+        and data is its raw bytes, or None if there is no such object.
+        All calls share one long-lived `git cat-file --batch` process.
+        """
+        
+        # cat-file reads one name per line, so a newline would split this
+        # request in two and leave an unread reply in the pipe
+        if "\n" in hashKey:
+            raise ValueError("Object name contains a newline: " + repr(hashKey))
+        
+        if self._catFile is None:
+            self._catFile = subprocess.Popen(["git"] + _CAT_FILE_ARGS, bufsize=1<<20, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=None if self.log else subprocess.DEVNULL, cwd=self.path)
+        
+        self._catFile.stdin.write(hashKey.encode('ascii') + b"\n")
+        self._catFile.stdin.flush()
+        
+        # Each reply is "<hash> <type> <size>" then the contents and a
+        # newline, or "<input> missing" / "<input> ambiguous" when there is
+        # no single such object; <input> may itself contain spaces
+        header = self._catFile.stdout.readline()
+        if not header:
+            raise subprocess.CalledProcessError(self._catFile.wait(), ["git"] + _CAT_FILE_ARGS)
+        if header.endswith(b" missing\n") or header.endswith(b" ambiguous\n"):
+            return None
+        (_, objType, size) = header.rsplit(b" ", 2)
+        data = self._catFile.stdout.read(int(size) + 1)[:-1]
+        return (objType.decode('ascii'), data)
+    
+    def close(self):
+        """
+        Shut down the `git cat-file` process used by readObject, if any.
+        """
+        
+        if self._catFile is not None:
+            self._catFile.stdin.close()
+            self._catFile.wait()
+            self._catFile.stdout.close()
+            self._catFile = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def _runGit(self, args):
+        """
+        Run git with the given arguments in this repository. Returns a
+        tuple (status, output), with non-ASCII bytes stripped from the
+        output.
+        """
+        
+        gitProcess = subprocess.Popen(["git"] + args, stdin=None, stdout=subprocess.PIPE, stderr=None if self.log else subprocess.DEVNULL, cwd=self.path)
+        
+        # Read straight from the pipe in large chunks
+        fd = gitProcess.stdout.fileno()
+        chunks = []
+        chunk = os.read(fd, 1<<20)
+        while chunk:
+            chunks.append(chunk)
+            chunk = os.read(fd, 1<<20)
+        gitProcess.stdout.close()
+        
+        output = b"".join(chunks).translate(None, _HIGH_BYTES)
+        return (gitProcess.wait(), output)
 
 class Parser:
     """
@@ -65,58 +231,88 @@ class Parser:
         if self.log:
             self.logger = logging.getLogger('pygitlog.Parser')
         else:
-            self.logger = NullLogger()
+            self.logger = _NULL_LOGGER
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
     
     def clear(self):
         """
         Remove any past results from this parser.
         """
-        self._currentCommit = None
         self._commits = {}
         self._authors = {}
+        self._authorIndex = {}
+        self._authorList = []
+        self._epochs = array('q')
+        self._timezones = array('h')
+        self._authorIndices = array('i')
+        self._rows = {}
+        self._parentOffsets = array('i', [0])
+        self._parentIndices = array('i')
+        self._columns = None
         self._committers = {}
         self._developers = {}
     
     def parse(self, text):
         """
         Parse the raw text of a Git history into a list of GitCommit
-        objects. Expects a single unbroken string (not a list of
-        strings representing lines). Clears any past parse results
+        objects. Expects the complete `git log --pretty=raw` output as a
+        single bytes object, listing parents before their children (as
+        with --reverse --topo-order). Clears any past parse results
         stored in this Parser.
         """
         
         self.clear()
-        lines = text.split("\n")
         self.logger.info("Parsing Git history")
         
-        for line in lines:
-            if len(line) == 0:
-                # Line is a spacer
-                pass
-                
-            elif line[0] == ' ':
-                # Line is part of a commit message
-                pass
-                
-            else:
-                # Line is part of a commit header
-                spaceIdx = line.find(' ')
-                if spaceIdx == -1:
-                    self.logger.warn("Skipping unrecognizable history line: " + line)
-                    continue
-                
-                keyword = line[:spaceIdx]
-                content = line[spaceIdx+1:]
-                self.logger.debug("Found key-value pair: {0} {1}".format(keyword, content))
-                
-                self._handleKeyValue(keyword, content)
-        
-        # Grab the last commit
-        self._commits[self._currentCommit.hashKey] = self._currentCommit
-        self._currentCommit = None
-        
-        # Finalize the commit tree
-        self._resolveCommits()
+        intern = sys.intern
+        debug = self._debug
+        text = b"\n" + text
+        found = 0
+        for m in _COMMIT_RE.finditer(text):
+            found += 1
+            (hashKey, tree, parentLines, author, committer) = [g.decode('ascii', 'replace') for g in m.groups()]
+            if debug:
+                self.logger.debug("Found commit %s", hashKey)
+            commit = Commit(hashKey=intern(hashKey), parents=[intern(k) for k in parentLines.split()[1::2]], tree=intern(tree))
+            (developer, timestamp) = self._findDeveloperAndTimestamp(author)
+            self._addAuthor(commit, developer, timestamp)
+            (developer, timestamp) = self._findDeveloperAndTimestamp(committer)
+            self._addCommitter(commit, developer)
+            self._storeCommit(commit)
+        
+        # _COMMIT_RE only matches header blocks in the usual tree, parent,
+        # author, committer order; anything else is skipped, so say so
+        expected = text.count(b"\ncommit ")
+        if found < expected:
+            self.logger.warning("Skipped %d of %d commits with unrecognizable headers", expected - found, expected)
+        
+        self._buildColumns()
+    
+    def parseFormatted(self, text):
+        """
+        Parse Git history produced by `git log` with _FORMAT_ARGS into a
+        list of GitCommit objects. Expects the complete output as a
+        single bytes object. Clears any past parse results stored in
+        this Parser.
+        """
+        
+        self.clear()
+        self.logger.info("Parsing formatted Git history")
+        
+        # Hash keys are interned so repeated hashes share one string and
+        # parent lookups hit the identity fast path
+        intern = sys.intern
+        fields = text.decode('ascii', 'replace').split('\0')
+        for i in range(0, len(fields) - _FORMAT_FIELDS + 1, _FORMAT_FIELDS):
+            (hashKey, parentKeys, tree, authorName, authorEmail, authorEpoch, authorTz, committerName, committerEmail, committerEpoch, committerTz) = fields[i:i + _FORMAT_FIELDS]
+            commit = Commit(hashKey=intern(hashKey), parents=[intern(k) for k in parentKeys.split()], tree=intern(tree))
+            # git only trims trailing whitespace from %an and none from
+            # %ae; trim both fully, as _parseDeveloperKey does
+            self._addAuthor(commit, self._findDeveloper(authorName.strip(), authorEmail.strip()), Timestamp(authorEpoch, authorTz))
+            self._addCommitter(commit, self._findDeveloper(committerName.strip(), committerEmail.strip()))
+            self._storeCommit(commit)
+        
+        self._buildColumns()
     
     def getCommits(self):
         return self._commits
@@ -124,38 +320,8 @@ class Parser:
     def getAuthors(self):
         return self._authors
     
-    def _handleKeyValue(self, keyword, content):
-        if keyword == "commit":
-            if not self._currentCommit == None:
-                self._commits[self._currentCommit.hashKey] = self._currentCommit
-            self._currentCommit = Commit(hashKey=content)
-            
-        elif keyword == "author":
-            (developer, timestamp) = self._findDeveloperAndTimestamp(content)
-            
-            if not str(developer) in self._authors:
-                self._authors[str(developer)] = developer
-            self._currentCommit.author = developer
-            self._authors[str(developer)].commits[self._currentCommit.hashKey] = self._currentCommit
-            
-        elif keyword == "committer":
-            (developer, timestamp) = self._findDeveloperAndTimestamp(content)
-            
-            if not str(developer) in self._committers:
-                self._committers[str(developer)] = developer
-            self._currentCommit.committer = developer
-            
-        elif keyword == "parent":
-            if content in self._commits:
-                self._currentCommit.parents[content] = self._commits[content]
-            else:
-                self._currentCommit.parents[content] = content
-            
-        elif keyword == "tree":
-            self._currentCommit.tree = content
-            
-        else:
-            self.logger.warn("Ignoring unrecognized commit keyword: " + keyword)
+    def getColumns(self):
+        return self._columns
     
     def _findDeveloperAndTimestamp(self, text):
         """
@@ -163,40 +329,153 @@ class Parser:
         Returns a tuple (dev, ts).
         """
         
-        parts = text.split(' ')
-        
-        tz = parts.pop()
-        epoch = parts.pop()
+        (rest, _, tz) = text.rpartition(' ')
+        (devKey, _, epoch) = rest.rpartition(' ')
         timestamp = Timestamp(epoch, tz)
         
         # Get Developer, either from cache or by making new object
-        devKey = ' '.join(parts)
         if devKey in self._developers:
             developer = self._developers[devKey]
         else:
-            email = (re.findall("<.*>", devKey))[0].replace("<", "").replace(">", "")
-            self.logger.debug("Found author email {0}".format(email))
-            name = devKey.replace(" <{0}>".format(email), "")
-            self.logger.debug("Found author name {0}".format(name))
+            (name, email) = _parseDeveloperKey(devKey)
+            if self._debug:
+                self.logger.debug("Found author email %s", email)
+                self.logger.debug("Found author name %s", name)
             developer = Developer(name=name, email=email)
             self._developers[devKey] = developer
         
         return (developer, timestamp)
     
-    def _resolveCommits(self):
+    def _findDeveloper(self, name, email):
+        """
+        Get the Developer with the given name and email, either from
+        cache or by making a new object.
+        """
+        
+        devKey = (name, email)
+        if devKey in self._developers:
+            developer = self._developers[devKey]
+        else:
+            developer = Developer(name=name, email=email)
+            self._developers[devKey] = developer
+        
+        return developer
+    
+    def _addAuthor(self, commit, developer, timestamp):
+        """
+        Record developer as the author of commit, both in the authors
+        dict and in the per-commit columns. Must be called once per
+        commit, in the order commits are stored.
+        """
+        
+        authorKey = str(developer)
+        if not authorKey in self._authors:
+            self._authors[authorKey] = developer
+            self._authorIndex[authorKey] = len(self._authorList)
+            self._authorList.append(developer)
+        commit.author = developer
+        self._authors[authorKey].commits[commit.hashKey] = commit
+        
+        tz = timestamp.timezone
+        tzMinutes = int(tz[1:3]) * 60 + int(tz[3:5])
+        self._epochs.append(int(timestamp.epoch))
+        self._timezones.append(-tzMinutes if tz[0] == '-' else tzMinutes)
+        self._authorIndices.append(self._authorIndex[authorKey])
+    
+    def _addCommitter(self, commit, developer):
+        """
+        Record developer as the committer of commit.
+        """
+        
+        if not str(developer) in self._committers:
+            self._committers[str(developer)] = developer
+        commit.committer = developer
+    
+    def _storeCommit(self, commit):
+        """
+        Add a fully parsed Commit to the results, replacing its parent
+        hash keys with the corresponding Commit objects. History is read
+        parents-first, so every parent has already been stored; parents
+        outside the parsed history (e.g. in a shallow clone) are left as
+        hash keys.
+        """
+        
+        rows = self._rows
+        parentIndices = self._parentIndices
+        parents = []
+        for parentKey in commit.parents:
+            parents.append(self._commits.get(parentKey, parentKey))
+            parentIndices.append(rows.get(parentKey, -1))
+        commit.parents = parents
+        self._parentOffsets.append(len(parentIndices))
+        
+        rows[commit.hashKey] = len(rows)
+        self._commits[commit.hashKey] = commit
+    
+    def _buildColumns(self):
+        """
+        Gather the per-commit arrays recorded while parsing into a
+        CommitColumns object.
+        """
+        
+        self._columns = CommitColumns(hashKeys=list(self._commits), epochs=self._epochs, timezones=self._timezones, authorIndices=self._authorIndices, authors=self._authorList, parentOffsets=self._parentOffsets, parentIndices=self._parentIndices)
+
+class Walker(Parser):
+    """
+    Builds the same results as Parser, but reads commits straight out of
+    the repository with pygit2 rather than parsing `git log` output.
+    Only usable when pygit2 is installed. Like the `git log` path,
+    non-ASCII bytes are stripped from developer names and emails.
+    """
+    
+    def __init__(self, log=False):
+        Parser.__init__(self, log=log)
+        if self.log:
+            self.logger = logging.getLogger('pygitlog.Walker')
+            self._debug = self.logger.isEnabledFor(logging.DEBUG)
+    
+    def walk(self, path):
         """
-        Iterate through all Commits being processed and replace any parent
-        hash key placeholders with their corresponding Commit objects.
-        Typically run at the end of a parse to ensure that all Commits are
-        linked properly.
+        Walk the history of the repository at path, starting from HEAD.
+        Clears any past results stored in this Walker.
         """
         
-        self.logger.info("Resolving {0} commit parents".format(sum(map((lambda x : len([p for p in self._commits[x].parents if isinstance(self._commits[x].parents[p], str)])), self._commits))))
-        for hashKey in self._commits:
-            for parentKey in self._commits[hashKey].parents:
-                if isinstance(self._commits[hashKey].parents[parentKey], str):
-                    self.logger.debug("Replacing parent key {0} with actual commit".format(parentKey))
-                    self._commits[hashKey].parents[parentKey] = self._commits[parentKey]
+        self.clear()
+        repo = pygit2.Repository(path)
+        self.logger.info("Walking Git history")
+        
+        intern = sys.intern
+        
+        for c in repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_REVERSE):
+            commit = Commit(hashKey=intern(str(c.id)), parents=[intern(str(p)) for p in c.parent_ids], tree=intern(str(c.tree_id)))
+            
+            (developer, timestamp) = self._signatureDeveloperAndTimestamp(c.author)
+            self._addAuthor(commit, developer, timestamp)
+            
+            (developer, timestamp) = self._signatureDeveloperAndTimestamp(c.committer)
+            self._addCommitter(commit, developer)
+            
+            self._storeCommit(commit)
+        
+        self._buildColumns()
+    
+    def _signatureDeveloperAndTimestamp(self, signature):
+        """
+        Given a pygit2 Signature, break out a Developer and Timestamp
+        object. Returns a tuple (dev, ts).
+        """
+        
+        offset = abs(signature.offset)
+        tz = "{0}{1:02d}{2:02d}".format("-" if signature.offset < 0 else "+", offset // 60, offset % 60)
+        timestamp = Timestamp(str(signature.time), tz)
+        
+        # Strip non-ASCII bytes the same way History._runGit does, then
+        # trim whitespace the way _parseDeveloperKey does; libgit2 trims
+        # before the bytes are removed, which can leave a trailing space
+        name = signature.raw_name.translate(None, _HIGH_BYTES).decode('ascii').strip()
+        email = signature.raw_email.translate(None, _HIGH_BYTES).decode('ascii').strip()
+        
+        return (self._findDeveloper(name, email), timestamp)
 
 class Commit:
     """
@@ -209,17 +488,46 @@ class Commit:
      - tree is the string SHA1 hash of the commit blob's tree blob
     """
     
+    __slots__ = ('hashKey', 'author', 'committer', 'parents', 'tree')
+    
     def __init__(self, hashKey, author=None, committer=None, parents=None, tree=None):
         self.hashKey = hashKey
         self.author = author
         self.committer = committer
-        if not isinstance(parents, dict):
-            self.parents = {}
+        if not isinstance(parents, list):
+            self.parents = []
         else:
             self.parents = parents
         self.tree = tree
 
+class CommitColumns:
+    """
+    Column-oriented view of a parsed history, for analyses that would
+    otherwise have to visit every Commit object. Row i of each column
+    describes the commit hashKeys[i], where:
+     - epochs holds author timestamps, in seconds since the Unix epoch
+     - timezones holds author timezone offsets from UTC, in minutes
+     - authorIndices holds indices into authors, a list of Developers
+     - parentOffsets and parentIndices store parent rows in CSR form:
+       the parents of row i are
+       parentIndices[parentOffsets[i]:parentOffsets[i + 1]], with -1
+       standing in for parents outside the parsed history
+    """
+    
+    __slots__ = ('hashKeys', 'epochs', 'timezones', 'authorIndices', 'authors', 'parentOffsets', 'parentIndices')
+    
+    def __init__(self, hashKeys, epochs, timezones, authorIndices, authors, parentOffsets, parentIndices):
+        self.hashKeys = hashKeys
+        self.epochs = epochs
+        self.timezones = timezones
+        self.authorIndices = authorIndices
+        self.authors = authors
+        self.parentOffsets = parentOffsets
+        self.parentIndices = parentIndices
+
 class Developer:
+    __slots__ = ('name', 'email', 'commits')
+    
     def __init__(self, name, email):
         self.name = name
         self.email = email
@@ -229,25 +537,11 @@ class Developer:
         return "{0} <{1}>".format(self.name, self.email)
 
 class Timestamp:
+    __slots__ = ('epoch', 'timezone')
+    
     def __init__(self, epoch, timezone):
         self.epoch = epoch
         self.timezone = timezone
 
-class NullLogger:
-    """
-    Convenience class that ignores all log messages sent to it.
-    """
-    
-    def debug(self, text):
-        pass
-    def info(self, text):
-        pass
-    def warn(self, text):
-        pass
-    def error(self, text):
-        pass
-    def critical(self, text):
-        pass
-
 # Set up logging
 logging.basicConfig(filename="pygitlog.log", level=logging.INFO, filemode='w')
\ No newline at end of file